@@ -6,382 +6,300 @@ Preserves original formatting exactly
 """
 
 import argparse
-from pypinyin import pinyin, Style
+import importlib.metadata
+import itertools
 import os
+import re
+import shutil
+import sys
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
-def add_pinyin_preserve_format(chinese_text):
+# Number of CJK Unified Ideographs (U+4E00 to U+9FFF) covered by the pinyin table
+CJK_COUNT = 0xa000 - 0x4e00
+
+# Binary cache of the pinyin table, so pypinyin only has to be imported to (re)build it
+PINYIN_TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pinyin_table.bin')
+
+# Layout version of the pinyin table file; bump whenever the format changes
+PINYIN_TABLE_FORMAT = 1
+
+# The table file starts with a magic carrying the format version, then the pypinyin
+# version it was built from (NUL-padded), so a stale table is rebuilt instead of reused
+PINYIN_TABLE_MAGIC = b'PYT' + bytes([PINYIN_TABLE_FORMAT])
+PINYIN_TABLE_VERSION_SIZE = 60
+
+
+def installed_pypinyin_version():
     """
-    Add pinyin above Chinese characters while preserving all original content exactly
+    Return the installed pypinyin version from package metadata (without importing
+    pypinyin), or None if there is no metadata (not installed, or e.g. vendored or on
+    PYTHONPATH as a source checkout)
     """
-    lines = chinese_text.split('\n')
-    result_lines = []
-    
-    for line in lines:
-        # Process line character by character to maintain perfect alignment
-        pinyin_line = ""
-        original_line = ""
-        
-        i = 0
-        while i < len(line):
-            char = line[i]
-            
-            if '\u4e00' <= char <= '\u9fff':  # Chinese character
-                # Get pinyin for this character
-                py = pinyin(char, style=Style.TONE, heteronym=False)[0][0]
-                # Add pinyin to pinyin line
-                pinyin_line += py.ljust(len(char) + 2)  # Add some padding
-                # Add original character to original line
-                original_line += char.ljust(len(char) + 2)
-            else:
-                # For non-Chinese characters (spaces, punctuation, etc.)
-                # Add same character to both lines
-                pinyin_line += ' ' * len(char)  # Space in pinyin line
-                original_line += char  # Original character in original line
-            
-            i += 1
-        
-        # Only add pinyin line if the original line had Chinese characters
-        if any('\u4e00' <= char <= '\u9fff' for char in line):
-            result_lines.append(pinyin_line.rstrip())  # Remove trailing spaces from pinyin line
-        
-        result_lines.append(line)  # Add original line
-    
-    return '\n'.join(result_lines)
+    try:
+        return importlib.metadata.version('pypinyin')
+    except importlib.metadata.PackageNotFoundError:
+        return None
 
 
-def add_pinyin_preserve_format_new(chinese_text):
+def read_pypinyin_table():
     """
-    Improved method to add pinyin above Chinese characters while preserving formatting
+    Return the default tone-marked pinyin of every CJK character from pypinyin's
+    single-character table ('' where it has none)
     """
-    from pypinyin import pinyin, Style, lazy_pinyin
-    
-    lines = chinese_text.split('\n')
-    result_lines = []
+    if 'pypinyin' in sys.modules:
+        # Already imported (and configured) by the host program; just reuse it
+        from pypinyin import pinyin_dict
+        return default_readings(pinyin_dict.pinyin_dict)
     
-    for line in lines:
-        if not line.strip():
-            result_lines.append(line)
-            continue
-            
-        # Identify Chinese characters and their positions
-        pinyin_parts = []
-        original_parts = []
-        
-        i = 0
-        while i < len(line):
-            char = line[i]
-            
-            if '\u4e00' <= char <= '\u9fff':  # Chinese character
-                # Get pinyin for this character
-                py = pinyin(char, style=Style.TONE, heteronym=False)[0][0]
-                pinyin_parts.append((i, py))
-            i += 1
-        
-        # Build the pinyin line based on original line structure
-        pinyin_line = [' '] * len(line)
-        original_line = list(line)
-        
-        for pos, py in pinyin_parts:
-            # Place pinyin at the correct position
-            # We'll put the pinyin in a separate line above the original
-            pass
-        
-        # Instead, let's build character-by-character
-        pinyin_str = ""
-        for char in line:
-            if '\u4e00' <= char <= '\u9fff':
-                py = pinyin(char, style=Style.TONE, heteronym=False)[0][0]
-                pinyin_str += py + "  "  # Add padding
-            else:
-                # For non-Chinese characters, add equivalent spaces in pinyin line
-                pinyin_str += " " * len(char)  # This is just 1 for single char
-        
-        # Actually, we need a different approach - let's map each original character position
-        # to either a pinyin string or a space
-        pinyin_line = ""
-        char_idx = 0
-        
-        for char in line:
-            if '\u4e00' <= char <= '\u9fff':  # Chinese character
-                py = pinyin(char, style=Style.TONE, heteronym=False)[0][0]
-                pinyin_line += py.ljust(len(char) + 2)  # Pad with spaces to align
+    # Only single characters are looked up, so have pypinyin skip loading the phrase
+    # dictionary and copying the single-character one. pypinyin reads these switches
+    # at import, so set them only around our import and drop its modules afterwards;
+    # a later import by the host program then starts fresh with its own settings
+    saved_env = {name: os.environ.get(name) for name in ('PYPINYIN_NO_PHRASES', 'PYPINYIN_NO_DICT_COPY')}
+    for name in saved_env:
+        os.environ.setdefault(name, 'true')
+    try:
+        from pypinyin import pinyin_dict
+        return default_readings(pinyin_dict.pinyin_dict)
+    finally:
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
             else:
-                pinyin_line += " " * len(char)  # Space for non-Chinese char
-        
-        # Only add pinyin line if there were Chinese characters in the line
-        if any('\u4e00' <= char <= '\u9fff' for char in line):
-            result_lines.append(pinyin_line.rstrip())
-        
-        result_lines.append(line)
-    
-    return '\n'.join(result_lines)
+                os.environ[name] = value
+        for name in [m for m in sys.modules if m == 'pypinyin' or m.startswith('pypinyin.')]:
+            del sys.modules[name]
 
 
-def add_pinyin_preserve_format_corrected(chinese_text):
+def default_readings(readings):
     """
-    Correct method to add pinyin above Chinese characters while preserving formatting
+    Return the first (default) reading of each CJK character in a pypinyin
+    codepoint -> 'reading,reading' dictionary ('' where it has none)
     """
-    lines = chinese_text.split('\n')
-    result_lines = []
+    return [readings[cp].split(',', 1)[0] if cp in readings else '' for cp in range(0x4e00, 0xa000)]
+
+
+def write_pinyin_table(pinyins, version, path=PINYIN_TABLE_FILE):
+    """
+    Write pinyin readings built from pypinyin version to path: PINYIN_TABLE_MAGIC, the
+    NUL-padded version, uint32 offsets[CJK_COUNT + 1], then a UTF-8 blob
+    """
+    version_field = version.encode('utf-8')
+    if len(version_field) > PINYIN_TABLE_VERSION_SIZE:
+        raise ValueError(f"pypinyin version too long for the pinyin table: {version}")
     
-    for line in lines:
-        if not line.strip():
-            result_lines.append(line)
-            continue
-            
-        # Create pinyin and character mapping
-        pinyin_chars = []
-        original_chars = []
-        
-        for char in line:
-            if '\u4e00' <= char <= '\u9fff':  # Chinese character
-                py = pinyin(char, style=Style.TONE, heteronym=False)[0][0]
-                pinyin_chars.append(py)
-                original_chars.append(char)
-            else:  # Non-Chinese character (punctuation, space, etc.)
-                pinyin_chars.append(' ')  # Space in pinyin line
-                original_chars.append(char)  # Original character
-        
-        # Now build the pinyin line ensuring proper spacing
-        pinyin_line = ""
-        original_line = ""
-        
-        for i, char in enumerate(line):
-            if '\u4e00' <= char <= '\u9fff':  # Chinese character
-                py = pinyin(char, style=Style.TONE, heteronym=False)[0][0]
-                pinyin_line += py.ljust(6)  # Pad pinyin to align with Chinese character
-                original_line += char.ljust(6)  # Pad original character too
-            else:  # Non-Chinese character
-                pinyin_line += char  # Same character in pinyin line
-                original_line += char  # Same character in original line
-        
-        # Adjust spacing to match original line length
-        if any('\u4e00' <= c <= '\u9fff' for c in line):
-            result_lines.append(pinyin_line.rstrip())
-        result_lines.append(original_line.rstrip())
+    blobs = [py.encode('utf-8') for py in pinyins]
+    offsets = array('I', itertools.accumulate(map(len, blobs), initial=0))
     
-    return '\n'.join(result_lines)
+    # Write to a temporary file first so concurrent readers never see a partial table
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(PINYIN_TABLE_MAGIC)
+            f.write(version_field.ljust(PINYIN_TABLE_VERSION_SIZE, b'\0'))
+            f.write(offsets.tobytes())
+            f.write(b''.join(blobs))
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
-def add_pinyin_preserve_format_final(chinese_text):
+def read_pinyin_table(path=PINYIN_TABLE_FILE, version=None):
     """
-    Final corrected method to add pinyin above Chinese characters while preserving formatting
+    Read pinyin readings back from a table written by write_pinyin_table.
+    Raises ValueError if the file is malformed, has another format, or (when version
+    is given) was built from a different pypinyin version.
     """
-    from pypinyin import pinyin, Style
+    key_size = len(PINYIN_TABLE_MAGIC) + PINYIN_TABLE_VERSION_SIZE
+    header_size = key_size + (CJK_COUNT + 1) * 4
+    # Every reading is decoded up front anyway, so a plain read is all that is needed
+    with open(path, 'rb') as f:
+        data = f.read()
     
-    lines = chinese_text.split('\n')
-    result_lines = []
+    if len(data) < header_size:
+        raise ValueError(f"Truncated pinyin table: {path}")
+    if data[:len(PINYIN_TABLE_MAGIC)] != PINYIN_TABLE_MAGIC:
+        raise ValueError(f"Unknown pinyin table format: {path}")
+    built_from = data[len(PINYIN_TABLE_MAGIC):key_size].rstrip(b'\0').decode('utf-8')
+    if version is not None and built_from != version:
+        raise ValueError(f"Pinyin table built from pypinyin {built_from}, not {version}: {path}")
     
-    for line in lines:
-        if not line.strip():
-            result_lines.append(line)
-            continue
-            
-        # Build pinyin line by processing each character
-        pinyin_line = ""
-        char_pos = 0
-        
-        while char_pos < len(line):
-            char = line[char_pos]
-            
-            if '\u4e00' <= char <= '\u9fff':  # Chinese character
-                py = pinyin(char, style=Style.TONE, heteronym=False)[0][0]
-                # Add pinyin with proper spacing to match original character width
-                pinyin_line += py.ljust(2)  # Use 2 spaces to separate from next
-            else:  # Non-Chinese character
-                # Add the same character to pinyin line (typically space or punctuation)
-                pinyin_line += " " * len(char)  # This will be just 1 space for single char
-            
-            char_pos += 1
-        
-        # Only add pinyin line if there are Chinese characters in the original line
-        if any('\u4e00' <= c <= '\u9fff' for c in line):
-            result_lines.append(pinyin_line.rstrip())
-        
-        result_lines.append(line)
+    bounds = array('I', data[key_size:header_size]).tolist()
+    if bounds[-1] != len(data) - header_size:
+        raise ValueError(f"Corrupt pinyin table: {path}")
     
-    return '\n'.join(result_lines)
+    blob = data[header_size:]
+    return [blob[start:end].decode('utf-8') for start, end in zip(bounds, bounds[1:])]
 
 
-def add_pinyin_preserve_format_best(chinese_text):
+def load_pinyin_table(path=PINYIN_TABLE_FILE):
     """
-    Best approach: Process each line to add pinyin preserving exact formatting
+    Return pinyin readings from the binary table, building it from pypinyin if it
+    is missing, unreadable or stale (built from another pypinyin version or format)
     """
-    from pypinyin import pinyin, Style
+    version = installed_pypinyin_version()
+    if version is None:
+        # Without metadata a cached table cannot be checked against pypinyin, so build
+        # from pypinyin (without caching); only if pypinyin cannot be imported at all
+        # fall back to whatever readable table there is
+        try:
+            return read_pypinyin_table()
+        except ImportError:
+            return read_pinyin_table(path)
     
-    lines = chinese_text.split('\n')
-    result_lines = []
-    
-    for line in lines:
-        if not line.strip():
-            result_lines.append(line)
-            continue
-            
-        # Identify all Chinese characters and their positions
-        ch_chars = []
-        ch_positions = []
-        
-        for i, char in enumerate(line):
-            if '\u4e00' <= char <= '\u9fff':
-                ch_chars.append(char)
-                ch_positions.append(i)
-        
-        if not ch_chars:
-            # No Chinese characters in this line, just add the original line
-            result_lines.append(line)
-            continue
-        
-        # Get pinyin for all Chinese characters
-        pinyin_list = pinyin(''.join(ch_chars), style=Style.TONE, heteronym=False)
-        pinyin_values = [p[0] for p in pinyin_list]
-        
-        # Create the pinyin line by mapping pinyin values back to their positions
-        pinyin_line = [' '] * len(line)  # Start with all spaces
-        
-        for pos, py_val in zip(ch_positions, pinyin_values):
-            # Insert pinyin value at the correct position
-            # We need to be careful about character width
-            py_len = len(py_val)
-            line_len = len(line)
-            
-            # Place pinyin value at the position, making sure not to exceed line length
-            end_pos = min(pos + py_len, line_len)
-            pinyin_line[pos:end_pos] = py_val[:end_pos-pos]
-            
-            # For better alignment, add extra spaces if needed
-            if end_pos < line_len and line[end_pos] != ' ':
-                # Add a separator between pinyin elements
-                pass
-        
-        # Convert pinyin line back to string
-        pinyin_str = ''.join(pinyin_line)
-        
-        # Add the pinyin line and then the original line
-        result_lines.append(pinyin_str)
-        result_lines.append(line)
+    try:
+        return read_pinyin_table(path, version)
+    except (OSError, ValueError):
+        pass
     
-    return '\n'.join(result_lines)
+    pinyins = read_pypinyin_table()
+    try:
+        write_pinyin_table(pinyins, version, path)
+    except (OSError, ValueError):
+        pass  # The table is only a cache; just rebuild from pypinyin next time
+    return pinyins
+
+
+# Character -> default tone-marked pinyin for every CJK character that has one
+CHAR2PY = {chr(0x4e00 + i): py for i, py in enumerate(load_pinyin_table()) if py}
 
+# Matches a single Chinese character
+CJK_RE = re.compile('[\u4e00-\u9fff]')
 
-def add_pinyin_preserve_format_working(chinese_text):
+# Codepoint ranges that are neither Chinese nor whitespace but common in Chinese text
+# (ASCII letters and punctuation, general punctuation, CJK punctuation, fullwidth forms)
+BLANK_RANGES = ((0x21, 0x7e), (0x2010, 0x2027), (0x3001, 0x303f), (0xff01, 0xff5e))
+
+
+def build_translate_table():
     """
-    Working approach to add pinyin above Chinese characters while preserving formatting
+    Return a str.translate table indexed by codepoint: padded pinyin for every CJK
+    character, a space for everything in BLANK_RANGES and the codepoint itself otherwise.
+    Indexing a list is cheaper than hashing into a dict, and str.translate leaves
+    codepoints past the end of the list unchanged.
     """
-    from pypinyin import pinyin, Style
-    
-    lines = chinese_text.split('\n')
-    result_lines = []
+    table = list(range(max(end for _, end in BLANK_RANGES) + 1))
+    for start, end in BLANK_RANGES:
+        table[start:end + 1] = [' '] * (end - start + 1)
+    table[0x4e00:0xa000] = [CHAR2PY.get(chr(cp), chr(cp)) + "  " for cp in range(0x4e00, 0xa000)]
+    return table
+
+
+PINYIN_TABLE = build_translate_table()
+
+# Matches any other character that is neither Chinese nor whitespace, i.e. what else
+# becomes a blank in the pinyin line; rare, so usually there is nothing to replace
+NON_CJK_RE = re.compile('[^\u4e00-\u9fff\\s%s]' % ''.join(
+    '%s-%s' % (re.escape(chr(start)), re.escape(chr(end))) for start, end in BLANK_RANGES))
+
+# Read/write buffer size used when streaming files
+IO_BUFFER_SIZE = 1 << 20
+
+# Number of lines converted together, and handed to a worker process at a time
+CHUNK_LINES = 1024
+
+
+def process_one_line(line):
+    """
+    Add pinyin above a single line (given without its newline).
+    Lines without Chinese characters (including blank ones) are returned unchanged.
+    """
+    # C-level scan that stops at the first Chinese character
+    if CJK_RE.search(line) is None:
+        return line
     
+    # Blank out uncommon punctuation, then let the table swap each Chinese character
+    # for its padded pinyin and blank the common punctuation; whitespace is kept
+    pinyin_line = NON_CJK_RE.sub(' ', line).translate(PINYIN_TABLE)
+    return pinyin_line.rstrip() + '\n' + line
+
+
+def add_pinyin_preserve_format_stream(lines):
+    """
+    Yield each of lines as read from a file (newlines included) with its pinyin line added above it
+    """
     for line in lines:
-        if not line.strip():
-            result_lines.append(line)
-            continue
-        
-        # Create character mapping
-        pinyin_mapping = []
-        
-        for i, char in enumerate(line):
-            if '\u4e00' <= char <= '\u9fff':  # Chinese character
-                py = pinyin(char, style=Style.TONE, heteronym=False)[0][0]
-                pinyin_mapping.append((i, py))
-        
-        if not pinyin_mapping:  # No Chinese characters in this line
-            result_lines.append(line)
-            continue
-        
-        # Create pinyin line with proper spacing
-        pinyin_line = [' '] * len(line)
-        
-        # Place pinyins at their corresponding positions
-        for pos, py in pinyin_mapping:
-            py_len = len(py)
-            # Place pinyin starting at the original character position
-            for j in range(min(py_len, len(line) - pos)):
-                pinyin_line[pos + j] = py[j]
-        
-        # Add pinyin line and original line
-        result_lines.append(''.join(pinyin_line))
-        result_lines.append(line)
-    
-    return '\n'.join(result_lines)
+        body = line.rstrip('\n')
+        yield process_one_line(body) + line[len(body):]  # Keep the original newline, if any
 
 
-def add_pinyin_preserve_format_optimized(chinese_text):
+def convert_chunk(lines):
     """
-    Proper approach to add pinyin above Chinese characters while preserving formatting.
-    Each Chinese character gets its own pinyin on the line above.
+    Convert a list of lines as read from a file (newlines included) and return the joined result
     """
-    from pypinyin import pinyin, Style
-    
-    lines = chinese_text.split('\n')
-    result_lines = []
+    return ''.join(add_pinyin_preserve_format_stream(lines))
+
+
+def convert_stream(fin, fout, jobs=1):
+    """
+    Convert lines from fin and write them to fout in order.
+    With jobs other than 1, chunks of lines are converted in worker processes (0 = one per CPU).
+    """
+    chunks = iter(lambda: list(itertools.islice(fin, CHUNK_LINES)), [])
     
-    for line in lines:
-        if not line.strip():
-            result_lines.append(line)
-            continue
-        
-        # Check if line has any Chinese characters
-        has_chinese = any('\u4e00' <= char <= '\u9fff' for char in line)
-        if not has_chinese:
-            result_lines.append(line)
-            continue
-        
-        # Get pinyin for Chinese characters while preserving positions
-        # We need to process this character by character
-        pinyin_line = ""
-        i = 0
-        while i < len(line):
-            char = line[i]
-            if '\u4e00' <= char <= '\u9fff':  # Chinese character
-                # Get the pinyin for this character
-                py = pinyin(char, style=Style.TONE, heteronym=False)[0][0]
-                # Add pinyin with padding to align properly
-                pinyin_line += py + "  "  # Add padding to separate from next pinyin
-            else:
-                # For non-Chinese characters, add the same character or a space
-                # If it's a punctuation, we might want to add a longer space to keep alignment
-                if char.isspace():
-                    pinyin_line += char  # Keep spaces in pinyin line too
-                else:
-                    # For punctuation, add spaces for alignment
-                    pinyin_line += " " * len(char)
-            i += 1
-        
-        result_lines.append(pinyin_line.rstrip())
-        result_lines.append(line)
+    if jobs == 1:
+        for chunk in chunks:
+            fout.write(convert_chunk(chunk))
+        return
     
-    return '\n'.join(result_lines)
+    workers = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Keep only a few chunks per worker in flight so memory stays bounded
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(convert_chunk, chunk))
+            if len(pending) > 2 * workers:
+                fout.write(pending.popleft().result())
+        while pending:
+            fout.write(pending.popleft().result())
 
 
-def process_file(input_file, output_file=None):
+def add_pinyin_preserve_format(chinese_text):
+    """
+    Add pinyin above Chinese characters while preserving formatting.
+    Each Chinese character gets its own pinyin on the line above.
+    """
+    return '\n'.join(process_one_line(line) for line in chinese_text.split('\n'))
+
+
+def process_file(input_file, output_file=None, jobs=1):
     """
     Process input file and generate output with pinyin
     """
     try:
-        # Read input file
-        with open(input_file, 'r', encoding='utf-8') as f:
-            chinese_text = f.read()
-        
-        # Generate pinyin output
-        pinyin_text = add_pinyin_preserve_format_optimized(chinese_text)
-        
         # Determine output filename
         if output_file is None:
             name, ext = os.path.splitext(input_file)
             output_file = f"{name}_pinyin{ext}"
         
-        # Write output file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(pinyin_text)
+        # Stream the input through the converter line by line, so only one
+        # buffer's worth of the file is held in memory at a time. Write to a
+        # temporary file and only move it into place once conversion succeeded,
+        # so a failure (or an output path equal to the input) never clobbers it
+        tmp_path = f"{output_file}.{os.getpid()}.tmp"
+        try:
+            with open(input_file, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as fin, \
+                    open(tmp_path, 'w', encoding='utf-8', buffering=IO_BUFFER_SIZE) as fout:
+                convert_stream(fin, fout, jobs)
+            if os.path.exists(output_file):
+                shutil.copymode(output_file, tmp_path)  # Keep the permissions of the file being replaced
+            os.replace(tmp_path, output_file)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
         
         print(f"Successfully processed: {input_file}")
         print(f"Output saved as: {output_file}")
         
-        # Also print to console
+        # Also print to console, streamed back from the output file
         print("\nPreview:")
         print("-" * 40)
-        print(pinyin_text)
+        with open(output_file, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+            shutil.copyfileobj(f, sys.stdout)
+        print()
         print("-" * 40)
         
     except FileNotFoundError:
@@ -389,18 +307,29 @@ def process_file(input_file, output_file=None):
     except Exception as e:
         print(f"Error processing file: {e}")
 
+def job_count(value):
+    """
+    argparse type for --jobs: a non-negative integer
+    """
+    jobs = int(value)
+    if jobs < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {jobs}")
+    return jobs
+
+
 def main():
     parser = argparse.ArgumentParser(description='Add pinyin above Chinese characters in a text file')
     parser.add_argument('input_file', help='Input Chinese text file')
     parser.add_argument('-o', '--output', help='Output file (optional)')
+    parser.add_argument('-j', '--jobs', type=job_count, default=1,
+                        help='Worker processes for conversion (default: 1, 0 = one per CPU)')
     
     args = parser.parse_args()
     
-    process_file(args.input_file, args.output)
+    process_file(args.input_file, args.output, args.jobs)
 
 if __name__ == "__main__":
     # If no command line arguments, prompt user
-    import sys
     if len(sys.argv) == 1:
         input_file = input("Enter the path to your Chinese text file: ")
         output_file = input("Enter output file path (or press Enter for auto-generated name): ").strip()